@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+AEBridge - Nuke 到 After Effects 的桥接工具包
+"""
@@ -4,6 +4,10 @@ YB Tools - Menu Registration
 
 This file executes after Nuke UI is loaded
 Responsible for adding our tools to the node menu, allowing users to create AEBridge nodes
+
+Only nuke, os and sys are imported at module level. Debug and background
+helpers (traceback, threading, time, updater) are imported inside the
+functions that use them so a normal menu load doesn't pay for them.
 """
 
 import nuke
@@ -11,11 +15,82 @@ import os
 import sys
 
 plugin_path = os.path.dirname(__file__)
+_YB_LOGO_PATH = os.path.join(plugin_path, 'yb_logo.png')
+
+# About window stylesheets (shared by every dialog instance)
+_ABOUT_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #e0e0e0;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 8px 16px;
+        min-height: 24px;
+        color: #e0e0e0;
+    }
+    QPushButton:hover {
+        background-color: #4a4a4a;
+        border: 1px solid #666666;
+    }
+    QPushButton:pressed {
+        background-color: #2a2a2a;
+    }
+    QPushButton:disabled {
+        background-color: #252525;
+        color: #666666;
+        border: 1px solid #333333;
+    }
+    QProgressBar {
+        border: 1px solid #555555;
+        border-radius: 4px;
+        background-color: #1e1e1e;
+        text-align: center;
+        color: #e0e0e0;
+        height: 20px;
+    }
+    QProgressBar::chunk {
+        background-color: #4a9eff;
+        border-radius: 3px;
+    }
+"""
 
-# Ensure Python can find AEBridge module
-aebridge_path = os.path.join(plugin_path, 'AEBridge')
-if aebridge_path not in sys.path:
-    sys.path.insert(0, aebridge_path)
+_CHECK_BTN_QSS = """
+    QPushButton {
+        background-color: #4a9eff;
+        border: 1px solid #3a8eef;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #5aaeff;
+        border: 1px solid #4a9eff;
+    }
+    QPushButton:pressed {
+        background-color: #3a8eef;
+    }
+"""
+
+# Auto-update status line of the About window, keyed by status
+_AUTO_UPDATE_HTML = {
+    "Enabled": "Auto-Update: <span style='color: #4a9eff;'>Enabled</span>",
+    "Disabled": "Auto-Update: <span style='color: #ff6b6b;'>Disabled</span>",
+}
+
+# Plain-text About message (version, auto-update status)
+_ABOUT_FALLBACK_TEXT = (
+    "YB Tools v{}\n\n"
+    "Nuke Node Toolset\n"
+    "Includes AE Bridge and other utility tools\n\n"
+    "Author: YB_\n"
+    "Project Homepage:\n"
+    "github.com/yongbin1999/YB_Nuke_ToolSets\n\n"
+    "Auto-Update: {}"
+)
 
 # Create YB submenu under Nodes menu (with our Logo)
 yb_menu = nuke.menu('Nodes').addMenu('YB', icon='yb_logo.png')
@@ -23,303 +98,367 @@ yb_menu = nuke.menu('Nodes').addMenu('YB', icon='yb_logo.png')
 # Track failed tools (for troubleshooting)
 failed_tools = []
 
-# Register AE Bridge tool
-try:
-    from AEBridge import ae_bridge
-    yb_menu.addCommand(
-        'AE Bridge',
-        lambda: ae_bridge.create_ae_bridge_node()
-    )
-    # Register callbacks: automatically manage input ports (similar to Merge node behavior)
-    ae_bridge.register_aebridge_callbacks()
-except Exception as e:
-    failed_tools.append('AE Bridge')
-    import traceback
-    traceback.print_exc()
 
+def _find_qt_binding():
+    """Return the name of the first installed Qt binding, or None"""
+    # PySide2 for Nuke 11+, PySide (Qt4) for older Python 2 builds
+    if sys.version_info[0] >= 3:
+        candidates = ('PySide2',)
+    else:
+        candidates = ('PySide', 'PySide2')
+    
+    try:
+        from importlib.util import find_spec
+    except ImportError:
+        # Python 2 has no importlib.util
+        import imp
+        
+        def find_spec(name):
+            try:
+                imp.find_module(name)
+                return name
+            except ImportError:
+                return None
+    
+    for name in candidates:
+        if find_spec(name) is not None:
+            return name
+    return None
 
-# Add menu separator and utility tools
-yb_menu.addSeparator()
 
-# Add About window with update check feature
+# Resolve Qt bindings once: one spec lookup per candidate instead of
+# catching failed imports
+_QtWidgets = _QtCore = _QtGui = None
+_QT_BINDING = _find_qt_binding()
 try:
-    import updater
-    
-    def show_about_window():
-        """Show About window with update check functionality"""
-        try:
-            current_version = updater.get_current_version()
-            auto_update_status = "Enabled" if updater.is_auto_update_enabled() else "Disabled"
+    if _QT_BINDING == 'PySide2':
+        from PySide2 import QtWidgets as _QtWidgets, QtCore as _QtCore, QtGui as _QtGui
+    elif _QT_BINDING == 'PySide':
+        from PySide import QtGui as _QtWidgets, QtCore as _QtCore, QtGui as _QtGui
+except ImportError:
+    # Binding is installed but failed to load
+    _QT_BINDING = None
+_QT_OK = _QT_BINDING is not None
+
+# YB logo icon, decoded once on first use
+_YB_LOGO_ICON = None
+
+
+def _get_logo_icon():
+    """Return the shared YB logo QIcon (Qt bindings must be available)"""
+    global _YB_LOGO_ICON
+    if _YB_LOGO_ICON is None:
+        _YB_LOGO_ICON = _QtGui.QIcon(_YB_LOGO_PATH)
+    return _YB_LOGO_ICON
+
+
+# About window (only available when Qt bindings are present)
+if _QT_OK:
+    class AboutDialog(_QtWidgets.QDialog):
+        # No __slots__: Shiboken wrappers always carry an instance __dict__,
+        # and only one dialog exists per session anyway
+        
+        # Shared fonts, built on first use (QFont is implicitly shared)
+        _title_font = None
+        _version_font = None
+        
+        @classmethod
+        def _get_title_font(cls):
+            if cls._title_font is None:
+                font = _QtGui.QFont()
+                font.setPointSize(24)
+                font.setBold(True)
+                cls._title_font = font
+            return cls._title_font
+        
+        @classmethod
+        def _get_version_font(cls):
+            if cls._version_font is None:
+                font = _QtGui.QFont()
+                font.setPointSize(12)
+                cls._version_font = font
+            return cls._version_font
+        
+        def __init__(self, current_version, auto_update_status, parent=None):
+            super(AboutDialog, self).__init__(parent)
+            self.setWindowTitle("About YB Tools")
+            self.setWindowIcon(_get_logo_icon())
+            self.setMinimumWidth(600)
+            self.setMinimumHeight(500)
+            self.setMaximumWidth(700)
+            self.setMaximumHeight(600)
             
-            import sys
-            if sys.version_info[0] >= 3:
-                from PySide2 import QtWidgets, QtCore, QtGui
-            else:
-                try:
-                    from PySide import QtGui as QtWidgets, QtCore, QtGui
-                except ImportError:
-                    try:
-                        from PySide2 import QtWidgets, QtCore, QtGui
-                    except ImportError:
-                        # Fallback to simple message
-                        nuke.message(
-                            "YB Tools v{}\n\n"
-                            "Nuke Node Toolset\n"
-                            "Includes AE Bridge and other utility tools\n\n"
-                            "Author: YB_\n"
-                            "Project Homepage:\n"
-                            "github.com/yongbin1999/YB_Nuke_ToolSets\n\n"
-                            "Auto-Update: {}".format(current_version, auto_update_status)
-                        )
-                        updater.manual_update_check()
-                        return
+            # Set window style
+            self.setStyleSheet(_ABOUT_QSS)
+            
+            # Widgets go straight into one layout; addSpacing pads section
+            # boundaries out to the 20px gap the nested layouts used to give
+            main_layout = _QtWidgets.QVBoxLayout()
+            main_layout.setSpacing(12)
+            main_layout.setContentsMargins(30, 30, 30, 30)
+            
+            # Static sections (title, description, author, homepage) are built
+            # once per session since show_about_window reuses this instance.
+            # They stay live widgets rather than a grabbed pixmap so the
+            # homepage link remains clickable and text scales with the display.
+            # Only auto_update_label changes, via refresh_status.
+            
+            # Title section
+            title_label = _QtWidgets.QLabel("YB Tools")
+            title_label.setFont(AboutDialog._get_title_font())
+            title_label.setStyleSheet("color: #4a9eff;")
+            main_layout.addWidget(title_label)
+            
+            self.version_label = _QtWidgets.QLabel("Version " + current_version)
+            self.version_label.setFont(AboutDialog._get_version_font())
+            self.version_label.setStyleSheet("color: #999999;")
+            main_layout.addWidget(self.version_label)
+            
+            # Separator
+            separator = _QtWidgets.QFrame()
+            separator.setFrameShape(_QtWidgets.QFrame.HLine)
+            separator.setFrameShadow(_QtWidgets.QFrame.Sunken)
+            separator.setStyleSheet("color: #555555;")
+            main_layout.addSpacing(8)
+            main_layout.addWidget(separator)
+            main_layout.addSpacing(8)
+            
+            # Info section
+            description_label = _QtWidgets.QLabel(
+                "Nuke Node Toolset\n"
+                "Includes AE Bridge and other utility tools"
+            )
+            description_label.setWordWrap(True)
+            description_label.setStyleSheet("color: #cccccc; padding: 10px 0;")
+            main_layout.addWidget(description_label)
+            
+            author_label = _QtWidgets.QLabel("Author: <span style='color: #4a9eff;'>YB_</span>")
+            author_label.setTextFormat(_QtCore.Qt.RichText)
+            author_label.setWordWrap(True)
+            main_layout.addWidget(author_label)
+            
+            homepage_label = _QtWidgets.QLabel(
+                "Project Homepage: <a href='https://github.com/yongbin1999/YB_Nuke_ToolSets' style='color: #4a9eff;'>github.com/yongbin1999/YB_Nuke_ToolSets</a>"
+            )
+            homepage_label.setOpenExternalLinks(True)
+            homepage_label.setTextFormat(_QtCore.Qt.RichText)
+            homepage_label.setWordWrap(True)
+            main_layout.addWidget(homepage_label)
             
-            class AboutDialog(QtWidgets.QDialog):
-                def __init__(self, parent=None):
-                    super(AboutDialog, self).__init__(parent)
-                    self.setWindowTitle("About YB Tools")
-                    self.setMinimumWidth(600)
-                    self.setMinimumHeight(500)
-                    self.setMaximumWidth(700)
-                    self.setMaximumHeight(600)
-                    
-                    # Set window style
-                    self.setStyleSheet("""
-                        QDialog {
-                            background-color: #2b2b2b;
-                            color: #e0e0e0;
-                        }
-                        QLabel {
-                            color: #e0e0e0;
-                        }
-                        QPushButton {
-                            background-color: #3d3d3d;
-                            border: 1px solid #555555;
-                            border-radius: 4px;
-                            padding: 8px 16px;
-                            min-height: 24px;
-                            color: #e0e0e0;
-                        }
-                        QPushButton:hover {
-                            background-color: #4a4a4a;
-                            border: 1px solid #666666;
-                        }
-                        QPushButton:pressed {
-                            background-color: #2a2a2a;
-                        }
-                        QPushButton:disabled {
-                            background-color: #252525;
-                            color: #666666;
-                            border: 1px solid #333333;
-                        }
-                        QProgressBar {
-                            border: 1px solid #555555;
-                            border-radius: 4px;
-                            background-color: #1e1e1e;
-                            text-align: center;
-                            color: #e0e0e0;
-                            height: 20px;
-                        }
-                        QProgressBar::chunk {
-                            background-color: #4a9eff;
-                            border-radius: 3px;
-                        }
-                    """)
-                    
-                    main_layout = QtWidgets.QVBoxLayout()
-                    main_layout.setSpacing(20)
-                    main_layout.setContentsMargins(30, 30, 30, 30)
-                    
-                    # Title section
-                    title_layout = QtWidgets.QVBoxLayout()
-                    title_layout.setSpacing(8)
-                    
-                    title_label = QtWidgets.QLabel("YB Tools")
-                    title_font = QtGui.QFont()
-                    title_font.setPointSize(24)
-                    title_font.setBold(True)
-                    title_label.setFont(title_font)
-                    title_label.setStyleSheet("color: #4a9eff;")
-                    title_layout.addWidget(title_label)
-                    
-                    version_label = QtWidgets.QLabel("Version {}".format(current_version))
-                    version_font = QtGui.QFont()
-                    version_font.setPointSize(12)
-                    version_label.setFont(version_font)
-                    version_label.setStyleSheet("color: #999999;")
-                    title_layout.addWidget(version_label)
-                    
-                    main_layout.addLayout(title_layout)
-                    
-                    # Separator
-                    separator = QtWidgets.QFrame()
-                    separator.setFrameShape(QtWidgets.QFrame.HLine)
-                    separator.setFrameShadow(QtWidgets.QFrame.Sunken)
-                    separator.setStyleSheet("color: #555555;")
-                    main_layout.addWidget(separator)
-                    
-                    # Info section
-                    info_layout = QtWidgets.QVBoxLayout()
-                    info_layout.setSpacing(12)
-                    
-                    description_label = QtWidgets.QLabel(
-                        "Nuke Node Toolset\n"
-                        "Includes AE Bridge and other utility tools"
-                    )
-                    description_label.setWordWrap(True)
-                    description_label.setStyleSheet("color: #cccccc; padding: 10px 0;")
-                    info_layout.addWidget(description_label)
-                    
-                    author_label = QtWidgets.QLabel("Author: <span style='color: #4a9eff;'>YB_</span>")
-                    author_label.setTextFormat(QtCore.Qt.RichText)
-                    author_label.setWordWrap(True)
-                    info_layout.addWidget(author_label)
-                    
-                    homepage_label = QtWidgets.QLabel(
-                        "Project Homepage: <a href='https://github.com/yongbin1999/YB_Nuke_ToolSets' style='color: #4a9eff;'>github.com/yongbin1999/YB_Nuke_ToolSets</a>"
-                    )
-                    homepage_label.setOpenExternalLinks(True)
-                    homepage_label.setTextFormat(QtCore.Qt.RichText)
-                    homepage_label.setWordWrap(True)
-                    info_layout.addWidget(homepage_label)
-                    
-                    auto_update_label = QtWidgets.QLabel(
-                        "Auto-Update: <span style='color: {};'>{}</span>".format(
-                            "#4a9eff" if auto_update_status == "Enabled" else "#ff6b6b",
-                            auto_update_status
-                        )
-                    )
-                    auto_update_label.setTextFormat(QtCore.Qt.RichText)
-                    info_layout.addWidget(auto_update_label)
-                    
-                    main_layout.addLayout(info_layout)
-                    
-                    # Separator
-                    separator2 = QtWidgets.QFrame()
-                    separator2.setFrameShape(QtWidgets.QFrame.HLine)
-                    separator2.setFrameShadow(QtWidgets.QFrame.Sunken)
-                    separator2.setStyleSheet("color: #555555;")
-                    main_layout.addWidget(separator2)
-                    
-                    # Update section
-                    update_layout = QtWidgets.QVBoxLayout()
-                    update_layout.setSpacing(12)
-                    
-                    # Update check button
-                    self.check_button = QtWidgets.QPushButton("Check for Updates")
-                    self.check_button.setStyleSheet("""
-                        QPushButton {
-                            background-color: #4a9eff;
-                            border: 1px solid #3a8eef;
-                            font-weight: bold;
-                        }
-                        QPushButton:hover {
-                            background-color: #5aaeff;
-                            border: 1px solid #4a9eff;
-                        }
-                        QPushButton:pressed {
-                            background-color: #3a8eef;
-                        }
-                    """)
-                    self.check_button.clicked.connect(self.check_updates)
-                    update_layout.addWidget(self.check_button)
-                    
-                    main_layout.addLayout(update_layout)
-                    
-                    # Spacer
-                    main_layout.addStretch()
-                    
-                    # Close button
-                    button_layout = QtWidgets.QHBoxLayout()
-                    button_layout.addStretch()
-                    close_button = QtWidgets.QPushButton("Close")
-                    close_button.clicked.connect(self.accept)
-                    close_button.setMinimumWidth(100)
-                    button_layout.addWidget(close_button)
-                    main_layout.addLayout(button_layout)
-                    
-                    self.setLayout(main_layout)
-                
-                def check_updates(self):
-                    """Check for updates"""
-                    # Disable button during check to prevent multiple clicks
-                    self.check_button.setEnabled(False)
-                    
-                    # Run update check in thread to avoid blocking UI
-                    import threading
-                    def _check():
-                        try:
-                            updater.manual_update_check()
-                        finally:
-                            # Re-enable button after check completes
-                            try:
-                                QtCore.QTimer.singleShot(0, lambda: self.check_button.setEnabled(True))
-                            except Exception:
-                                try:
-                                    nuke.executeInMainThread(lambda: self.check_button.setEnabled(True))
-                                except Exception:
-                                    self.check_button.setEnabled(True)
-                    
-                    thread = threading.Thread(target=_check)
-                    thread.daemon = True
-                    thread.start()
+            self.auto_update_label = _QtWidgets.QLabel()
+            self.auto_update_label.setTextFormat(_QtCore.Qt.RichText)
+            main_layout.addWidget(self.auto_update_label)
             
-            # Show dialog
-            dialog = AboutDialog()
-            dialog.exec_()
+            # Separator
+            separator2 = _QtWidgets.QFrame()
+            separator2.setFrameShape(_QtWidgets.QFrame.HLine)
+            separator2.setFrameShadow(_QtWidgets.QFrame.Sunken)
+            separator2.setStyleSheet("color: #555555;")
+            main_layout.addSpacing(8)
+            main_layout.addWidget(separator2)
+            main_layout.addSpacing(8)
             
-        except Exception as e:
-            # Fallback to simple message and update check
+            # Update section
+            # Update check button
+            self.check_button = _QtWidgets.QPushButton("Check for Updates")
+            self.check_button.setStyleSheet(_CHECK_BTN_QSS)
+            self.check_button.clicked.connect(self.check_updates)
+            main_layout.addWidget(self.check_button)
+            
+            # Spacer
+            main_layout.addStretch()
+            
+            # Close button (right-aligned)
+            close_button = _QtWidgets.QPushButton("Close")
+            close_button.clicked.connect(self.accept)
+            close_button.setMinimumWidth(100)
+            main_layout.addSpacing(8)
+            main_layout.addWidget(close_button, 0, _QtCore.Qt.AlignRight)
+            
+            self.setLayout(main_layout)
+            
+            self.refresh_status(auto_update_status)
+        
+        def refresh_status(self, auto_update_status):
+            """Update the labels that can change between opens"""
+            self.auto_update_label.setText(_AUTO_UPDATE_HTML[auto_update_status])
+        
+        def check_updates(self):
+            """Check for updates"""
+            # Disable button during check to prevent multiple clicks
+            self.check_button.setEnabled(False)
+            
+            # Run update check on Qt's shared thread pool to avoid blocking UI
+            _QtCore.QThreadPool.globalInstance().start(_UpdateCheckTask(self.check_button))
+        
+        @staticmethod
+        def _run_update_check(button):
+            """Run the manual update check, then re-enable the check button"""
             try:
-                nuke.message(
-                    "YB Tools v{}\n\n"
-                    "Nuke Node Toolset\n"
-                    "Includes AE Bridge and other utility tools\n\n"
-                    "Author: YB_\n"
-                    "Project Homepage:\n"
-                    "github.com/yongbin1999/YB_Nuke_ToolSets\n\n"
-                    "Auto-Update: {}".format(
-                        updater.get_current_version(),
-                        "Enabled" if updater.is_auto_update_enabled() else "Disabled"
-                    )
-                )
+                import updater
                 updater.manual_update_check()
-            except Exception:
-                pass
+            finally:
+                # Re-enable button after check completes (pool threads have no
+                # Qt event loop, so hand the call to Nuke's main thread)
+                try:
+                    nuke.executeInMainThread(button.setEnabled, (True,))
+                except Exception:
+                    try:
+                        _QtCore.QTimer.singleShot(0, lambda: button.setEnabled(True))
+                    except Exception:
+                        button.setEnabled(True)
     
+    class _UpdateCheckTask(_QtCore.QRunnable):
+        """Runs the manual update check on Qt's global thread pool"""
+        def __init__(self, button):
+            super(_UpdateCheckTask, self).__init__()
+            self.button = button
+        
+        def run(self):
+            AboutDialog._run_update_check(self.button)
+
+
+# Plugin version shown in the About window, read once per session
+_CURRENT_VERSION = None
+
+
+# About window with update check feature
+def show_about_window():
+    """Show About window with update check functionality"""
+    global _CURRENT_VERSION
+    
+    try:
+        # Imported on first use so menu loading doesn't pull in the
+        # updater and its network stack at every Nuke startup
+        import updater
+    except Exception as e:
+        # Broken or half-updated updater.py: still show the About text
+        nuke.message(_ABOUT_FALLBACK_TEXT.format(
+            "?", "Unavailable (updater could not be loaded: {})".format(e)
+        ))
+        return
+    
+    try:
+        # The running plugin's version can't change until Nuke restarts
+        if _CURRENT_VERSION is None:
+            _CURRENT_VERSION = updater.get_current_version()
+        current_version = _CURRENT_VERSION
+        auto_update_status = "Enabled" if updater.is_auto_update_enabled() else "Disabled"
+        
+        # Simple message when Qt is missing or YB_ABOUT_SIMPLE=1 is set
+        if not _QT_OK or os.environ.get('YB_ABOUT_SIMPLE') == '1':
+            nuke.message(_ABOUT_FALLBACK_TEXT.format(current_version, auto_update_status))
+            updater.manual_update_check()
+            return
+        
+        # Build the dialog once and reuse it on later opens
+        dialog = getattr(show_about_window, '_dialog', None)
+        if dialog is None:
+            dialog = AboutDialog(current_version, auto_update_status)
+            show_about_window._dialog = dialog
+        else:
+            dialog.refresh_status(auto_update_status)
+        
+        # Show dialog
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
+        
+    except Exception as e:
+        # Fallback to simple message and update check
+        try:
+            nuke.message(_ABOUT_FALLBACK_TEXT.format(
+                updater.get_current_version(),
+                "Enabled" if updater.is_auto_update_enabled() else "Disabled"
+            ))
+            updater.manual_update_check()
+        except Exception:
+            pass
+
+
+def _safe_start_update():
+    """Start the background update check, ignoring any failure"""
+    try:
+        import updater
+        updater.start_update_check()
+    except Exception:
+        pass
+
+
+# Set once the startup update check has been kicked off
+_UPDATE_CHECKED = False
+
+
+def _start_update_once():
+    """Start the update check the first time any startup trigger fires"""
+    global _UPDATE_CHECKED
+    if _UPDATE_CHECKED:
+        return
+    _UPDATE_CHECKED = True
+    try:
+        # Unregister the onScriptLoad trigger, queued so it isn't removed
+        # while Nuke is still looping over the script load callbacks
+        nuke.executeInMainThread(nuke.removeOnScriptLoad, (_start_update_once,))
+    except Exception:
+        pass
+    _safe_start_update()
+
+
+# Start update check after Nuke UI is loaded (deferred, non-blocking)
+def _delayed_update_check():
+    try:
+        # A script finishing loading means Nuke is ready
+        nuke.addOnScriptLoad(_start_update_once)
+        
+        # Sessions started without a script never fire onScriptLoad, so also
+        # queue the check behind UI startup on the main event loop
+        if _QT_OK:
+            _QtCore.QTimer.singleShot(3000, _start_update_once)
+        else:
+            nuke.executeInMainThread(_start_update_once)
+    except Exception:
+        pass
+
+
+def _setup_ae_bridge():
+    """Register AE Bridge tool"""
+    from AEBridge import ae_bridge
+    yb_menu.addCommand(
+        'AE Bridge',
+        ae_bridge.create_ae_bridge_node
+    )
+    # Register callbacks: automatically manage input ports (similar to Merge node behavior)
+    ae_bridge.register_aebridge_callbacks()
+
+
+def _setup_about():
+    """Add menu separator and About window"""
+    yb_menu.addSeparator()
     yb_menu.addCommand(
         'About YB Tools',
         show_about_window,
         icon=''
     )
-except Exception:
-    pass
 
 
-# Start update check after Nuke UI is loaded (delayed, non-blocking)
-def _delayed_update_check():
+def _register(name, fn):
+    """Run a registration step, recording failures instead of aborting menu load"""
     try:
-        import time
-        import threading
-        
-        def _check_after_delay():
-            # Wait a few seconds to ensure Nuke is fully loaded
-            time.sleep(3)
-            try:
-                import updater
-                updater.start_update_check()
-            except Exception:
-                pass
-        
-        thread = threading.Thread(target=_check_after_delay)
-        thread.daemon = True
-        thread.start()
+        fn()
     except Exception:
-        pass
+        failed_tools.append(name)
+        import traceback
+        traceback.print_exc()
+
+
+# Registration steps, executed in order after Nuke UI is loaded
+_REGISTRATIONS = (
+    ('AE Bridge', _setup_ae_bridge),
+    ('About', _setup_about),
+    ('DelayedUpdate', _delayed_update_check),
+)
+
+for _name, _fn in _REGISTRATIONS:
+    _register(_name, _fn)
 
-# Execute update check after Nuke UI is loaded
-try:
-    _delayed_update_check()
-except Exception:
-    pass
 
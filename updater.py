@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
 """
 YB Tools - Auto Update Module
+
+Only light modules are imported at module level. zipfile, shutil, tempfile
+and threading are imported inside the functions that use them, since most
+Nuke sessions never download or apply an update.
 """
 
 import os
 import json
-import threading
-import zipfile
-import shutil
-import tempfile
+import time
+
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2: no lru_cache, results are not memoized
+    def lru_cache(maxsize=128):
+        return lambda func: func
 
 # Version configuration file
 VERSION_CONFIG_FILE = "version.json"
@@ -19,7 +27,241 @@ GITHUB_REPO = "YB_Nuke_ToolSets"
 GITHUB_API_URL = "https://api.github.com/repos/{}/{}/releases/latest".format(GITHUB_USER, GITHUB_REPO)
 
 # Update configuration
-UPDATE_CHECK_TIMEOUT = 10  # Check timeout in seconds
+UPDATE_CHECK_TIMEOUT = 10  # Check read timeout in seconds
+CONNECT_TIMEOUT = 5  # Fail fast when GitHub can't be reached (seconds)
+OFFLINE_PROBE_TIMEOUT = 1  # TCP probe before background checks (seconds)
+
+# Cached GitHub release response: {"etag": ..., "payload": {...}, "fetched_at": ...}
+RELEASE_CACHE_FILE = "_etag_cache.json"
+MIN_CHECK_INTERVAL = 6 * 3600  # Background checks reuse the last response this long (seconds)
+RETRY_BACKOFF_BASE = 60  # First wait after a failed check, doubled per failure (seconds)
+RETRY_BACKOFF_MAX = 10 * 60  # Longest wait between failed background checks (seconds)
+
+# Download configuration
+DOWNLOAD_CHUNK_SIZE = 512 * 1024  # Bytes per read
+DOWNLOAD_WORKERS = 4  # Parallel range requests per download
+DOWNLOAD_PARALLEL_MIN_SIZE = 4 * 1024 * 1024  # Smaller files use a single stream
+DOWNLOAD_READ_TIMEOUT = 30  # Max wait for data on a download connection (seconds)
+DOWNLOAD_MEMORY_MAX_SIZE = 100 * 1024 * 1024  # Larger packages are downloaded to disk
+# ZIPs are already compressed: ask servers not to gzip them again, so
+# Content-Length and range offsets refer to the file itself
+DOWNLOAD_HEADERS = {'Accept-Encoding': 'identity'}
+UPDATER_WORKERS = 2  # Background threads shared by update checks and downloads
+
+
+# Shared urllib3 connection pool (created on first use, False if unavailable)
+_POOL = None
+
+
+def _proxies_configured():
+    """
+    Check for HTTP(S)_PROXY environment variables or system proxy settings
+    (Windows registry, macOS System Configuration)
+    """
+    try:
+        from urllib.request import getproxies
+    except ImportError:
+        from urllib import getproxies
+    try:
+        return bool(getproxies())
+    except Exception:
+        return False
+
+
+def _get_pool():
+    """
+    Get shared keep-alive connection pool, so the release check and the
+    download reuse connections instead of a new TLS handshake per request
+    
+    Returns None if urllib3 is not available or a proxy is configured
+    (urllib is used instead, it honors proxy and no_proxy settings)
+    """
+    global _POOL
+    if _POOL is None:
+        if _proxies_configured():
+            _POOL = False
+            return None
+        try:
+            import urllib3
+            _POOL = urllib3.PoolManager(
+                maxsize=DOWNLOAD_WORKERS,
+                headers={'User-Agent': 'YB-Tools-Updater', 'Connection': 'keep-alive'},
+                retries=urllib3.Retry(connect=1, read=0, redirect=5)
+            )
+        except Exception:
+            _POOL = False
+    return _POOL or None
+
+
+# Shared urllib opener used when urllib3 is unavailable (created on first use)
+_OPENER = None
+
+
+def _get_opener():
+    """
+    Get shared urllib opener with the updater's User-Agent preset
+    
+    Handlers are built once instead of per request. urllib itself has no
+    keep-alive, connection reuse needs urllib3 (see _get_pool).
+    """
+    global _OPENER
+    if _OPENER is None:
+        try:
+            from urllib.request import build_opener
+        except ImportError:
+            from urllib2 import build_opener
+        opener = build_opener()
+        # Set User-Agent (required by GitHub API)
+        opener.addheaders = [('User-Agent', 'YB-Tools-Updater')]
+        _OPENER = opener
+    return _OPENER
+
+
+def _open_url(url, headers=None, timeout=UPDATE_CHECK_TIMEOUT):
+    """
+    Open URL for streaming read (urllib3 pool if available, else urllib)
+    
+    Args:
+        url: URL to open
+        headers: Extra request headers (optional)
+        timeout: Read timeout in seconds. urllib3 uses CONNECT_TIMEOUT for
+            connecting; urllib only has one timeout for both
+    
+    Returns:
+        Response object with .headers and .read(size)
+    
+    Raises:
+        HTTPError for non-2xx responses, URLError on connection failure
+    """
+    try:
+        from urllib.request import Request
+        from urllib.error import URLError, HTTPError
+    except ImportError:
+        from urllib2 import Request, URLError, HTTPError
+    
+    pool = _get_pool()
+    if pool is None:
+        request = Request(url, headers=headers or {})
+        return _get_opener().open(request, timeout=timeout)
+    
+    import urllib3
+    request_headers = {'User-Agent': 'YB-Tools-Updater', 'Connection': 'keep-alive'}
+    request_headers.update(headers or {})
+    try:
+        response = pool.request(
+            'GET', url,
+            headers=request_headers,
+            timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=timeout),
+            preload_content=False
+        )
+    except urllib3.exceptions.HTTPError as e:
+        raise URLError(str(e))
+    
+    # Match urllib behavior: non-2xx responses raise HTTPError
+    if response.status >= 300:
+        response.release_conn()
+        raise HTTPError(url, response.status, response.reason, response.headers, None)
+    return response
+
+
+def _host_reachable(url):
+    """
+    Quick TCP connect to the URL's host, to detect an offline machine
+    without waiting for the full HTTP timeouts
+    
+    Behind a proxy the host usually can't be reached directly, so the
+    probe is skipped and the request itself decides.
+    
+    Returns:
+        bool: False if the host can't be resolved or connected to
+    """
+    if _proxies_configured():
+        return True
+    
+    import socket
+    try:
+        from urllib.parse import urlparse
+    except ImportError:
+        from urlparse import urlparse
+    
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    try:
+        socket.create_connection((parsed.hostname, port), OFFLINE_PROBE_TIMEOUT).close()
+        return True
+    except (socket.error, OSError):
+        return False
+
+
+def _release_response(response):
+    """Return connection to the pool (urllib3) or close it (urllib)"""
+    try:
+        release = getattr(response, 'release_conn', None) or response.close
+        release()
+    except Exception:
+        pass
+
+
+# Background task queue, {"queue": Queue} once the workers are started.
+# Plain threads rather than asyncio: Nuke's Python 2 builds have no asyncio,
+# aiohttp isn't bundled with Nuke, and the work is a few blocking requests.
+_WORKER_QUEUE = {}
+# Names of queued or running background tasks
+_IN_FLIGHT = {}
+
+
+def _worker_loop(tasks):
+    """Run background tasks from the queue forever"""
+    while True:
+        name, func = tasks.get()
+        try:
+            func()
+        except Exception:
+            pass
+        finally:
+            _IN_FLIGHT.pop(name, None)
+
+
+def _submit_task(name, func):
+    """
+    Run func on one of the shared background worker threads
+    
+    The workers are started on first use and reused afterwards, instead of
+    a new thread per check or download. A task whose name is already queued
+    or running is dropped rather than queued twice.
+    
+    Args:
+        name: Task name used to drop duplicate submissions
+        func: Callable without arguments
+    
+    Returns:
+        bool: True if the task was queued, False if it is already in flight
+    """
+    token = object()
+    # dict.setdefault is atomic, so only one caller can claim the name
+    if _IN_FLIGHT.setdefault(name, token) is not token:
+        return False
+    
+    tasks = _WORKER_QUEUE.get('queue')
+    if tasks is None:
+        try:
+            import queue
+        except ImportError:
+            # Python 2
+            import Queue as queue
+        import threading
+        
+        new_tasks = queue.Queue()
+        tasks = _WORKER_QUEUE.setdefault('queue', new_tasks)
+        if tasks is new_tasks:
+            for index in range(UPDATER_WORKERS):
+                worker = threading.Thread(target=_worker_loop, args=(tasks,),
+                                          name='yb-updater-{}'.format(index))
+                worker.daemon = True  # Daemon thread, won't block Nuke exit
+                worker.start()
+    
+    tasks.put((name, func))
+    return True
 
 
 def _nuke_tprint(message):
@@ -52,27 +294,51 @@ def _nuke_tprint(message):
         pass
 
 
+def _nuke_tprint_multi(lines):
+    """
+    Print several lines to Nuke terminal with a single main-thread call
+    
+    Args:
+        lines: List of message strings
+    """
+    _nuke_tprint('\n'.join(lines))
+
+
 def get_plugin_root():
     """Get plugin root directory"""
     return os.path.dirname(os.path.abspath(__file__))
 
 
-def load_version_config():
+# Parsed version.json, reused while the file's mtime is unchanged
+_CONFIG_CACHE = {'mtime': None, 'data': None}
+
+
+def _invalidate_version_cache():
+    """Force the next load_version_config() call to re-read version.json"""
+    _CONFIG_CACHE['mtime'] = None
+
+
+def _cached_version_config():
     """
-    Load version configuration from version.json
+    Get parsed version.json without copying it (callers must not modify it)
     
-    Returns:
-        dict: {"version": "2.2.1", "auto_update": true}
-        Returns default config if file doesn't exist or format is invalid
+    The parsed file is cached and only re-read when its mtime changes.
     """
+    import io
+    
     config_path = os.path.join(get_plugin_root(), VERSION_CONFIG_FILE)
     
     try:
+        mtime = os.stat(config_path).st_mtime
+        if mtime == _CONFIG_CACHE['mtime']:
+            return _CONFIG_CACHE['data']
+        
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except (UnicodeDecodeError, TypeError):
-            # Fallback for Python 2 or old files
+            # io.open decodes the same way on Python 2 and 3
+            with io.open(config_path, 'r', encoding='utf-8') as f:
+                config = json.loads(f.read())
+        except UnicodeDecodeError:
+            # Fallback for old files
             with open(config_path, 'r') as f:
                 config = json.load(f)
             
@@ -83,36 +349,136 @@ def load_version_config():
         # Enable auto-update by default
         if 'auto_update' not in config:
             config['auto_update'] = True
-            
+        
+        # Set data before mtime so a concurrent reader never pairs them wrongly
+        _CONFIG_CACHE['data'] = config
+        _CONFIG_CACHE['mtime'] = mtime
         return config
         
     except Exception:
         return {"version": "0.0.0", "auto_update": True}
 
 
+def load_version_config():
+    """
+    Load version configuration from version.json
+    
+    Returns:
+        dict: {"version": "2.2.1", "auto_update": true}
+        Returns default config if file doesn't exist or format is invalid
+    """
+    return dict(_cached_version_config())
+
+
+def _load_release_cache():
+    """Load cached GitHub release response, or {} if missing or invalid"""
+    cache_path = os.path.join(get_plugin_root(), RELEASE_CACHE_FILE)
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except Exception:
+        pass
+    return {}
+
+
+def _atomic_write_json(path, data, indent=None):
+    """
+    Write JSON file atomically
+    
+    Data goes to a temp file next to path, which is fsynced and then swapped
+    in, so a crash mid-write never leaves a truncated file behind.
+    
+    Args:
+        path: Target file path
+        data: JSON-serializable object
+        indent: JSON indent (optional)
+    """
+    import io
+    import threading
+    
+    # Unique per process and thread: the About dialog and the background
+    # worker can save the release cache at the same time. Not mkstemp, whose
+    # 0600 mode would carry over to shared version.json files.
+    tmp_path = '{}.tmp.{}.{}'.format(path, os.getpid(), threading.current_thread().ident)
+    text = json.dumps(data, indent=indent, ensure_ascii=False, separators=(',', ': '))
+    if isinstance(text, bytes):
+        # Python 2 returns a byte str when everything is ASCII
+        text = text.decode('utf-8')
+    
+    try:
+        with io.open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.replace(tmp_path, path)
+        except AttributeError:
+            # Python 2: rename overwrites on POSIX but not on Windows
+            try:
+                os.rename(tmp_path, path)
+            except OSError:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                os.rename(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _save_release_cache(cache):
+    """Save GitHub release response cache (failures are ignored)"""
+    cache_path = os.path.join(get_plugin_root(), RELEASE_CACHE_FILE)
+    try:
+        _atomic_write_json(cache_path, cache)
+    except Exception:
+        pass
+
+
 def get_current_version():
     """Get current version number"""
-    config = load_version_config()
+    config = _cached_version_config()
     return config.get('version', '0.0.0')
 
 
 def is_auto_update_enabled():
     """Check if auto-update is enabled"""
-    config = load_version_config()
+    config = _cached_version_config()
     return config.get('auto_update', True)
 
 
+# Largest value of each packed version field (10 bits)
+VERSION_FIELD_BITS = 32
+VERSION_FIELD_MAX = (1 << VERSION_FIELD_BITS) - 1
+
+
+@lru_cache(maxsize=32)
 def parse_version(version_str):
     """
-    Parse version string into comparable tuple
+    Parse version string into a comparable int (memoized, the same few
+    version strings are compared on every check)
+    
+    major.minor.patch is packed into 32-bit fields, wide enough for
+    date-based versions ("2024.1.0", "20240115"); missing parts count as 0.
+    Versions with a negative or wider field are treated as unparsable (0).
     """
     # Remove 'v' prefix
     version_str = version_str.lstrip('vV')
     try:
-        parts = version_str.split('.')
-        return tuple(int(p) for p in parts[:3])  # Only take first 3 parts
+        parts = [int(p) for p in version_str.split('.')[:3]]  # Only take first 3 parts
     except (ValueError, AttributeError):
-        return (0, 0, 0)
+        return 0
+    parts += [0] * (3 - len(parts))
+    if any(p < 0 or p > VERSION_FIELD_MAX for p in parts):
+        return 0
+    major, minor, patch = parts
+    return (major << (2 * VERSION_FIELD_BITS)) | (minor << VERSION_FIELD_BITS) | patch
 
 
 def compare_versions(current, latest):
@@ -124,15 +490,213 @@ def compare_versions(current, latest):
     0: latest == current (same version)
     -1: latest < current (local version is newer)
     """
-    current_tuple = parse_version(current)
-    latest_tuple = parse_version(latest)
+    # Common "no update" case: identical strings, nothing to parse
+    try:
+        if current.lstrip('vV') == latest.lstrip('vV'):
+            return 0
+    except AttributeError:
+        pass
+    
+    current_value = parse_version(current)
+    latest_value = parse_version(latest)
+    
+    return (latest_value > current_value) - (latest_value < current_value)
+
+
+class _BackoffActive(Exception):
+    """Raised instead of contacting GitHub while a backoff period is running"""
+    
+    def __init__(self, wait):
+        Exception.__init__(self, wait)
+        self.wait = wait
+
+
+def _retry_after_seconds(headers):
+    """
+    Get how long GitHub asks us to wait from response headers
+    
+    Returns:
+        float: Seconds to wait, or None if the response isn't rate limited
+    """
+    if headers is None:
+        return None
+    try:
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            return max(float(retry_after), 0)
+        if headers.get('X-RateLimit-Remaining') == '0':
+            return max(float(headers.get('X-RateLimit-Reset', 0)) - time.time(), 0)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def _record_check_failure(cache, error):
+    """
+    Persist backoff state for a failed release request
+    
+    Rate limits (X-RateLimit-Remaining: 0 or Retry-After) block every check
+    until GitHub's reset time. Server errors and network failures back off
+    exponentially (RETRY_BACKOFF_BASE doubled per failure, at most
+    RETRY_BACKOFF_MAX) and only delay background checks.
+    """
+    code = getattr(error, 'code', None)
+    headers = getattr(error, 'headers', None) or getattr(error, 'hdrs', None)
+    now = time.time()
+    
+    wait = _retry_after_seconds(headers) if code is not None else None
+    if wait is not None:
+        cache['rate_limit_until'] = now + wait
+    elif code is None or code >= 500:
+        failures = cache.get('failures', 0)
+        cache['retry_at'] = now + min(RETRY_BACKOFF_BASE * 2 ** failures, RETRY_BACKOFF_MAX)
+        cache['failures'] = failures + 1
+    else:
+        return
+    _save_release_cache(cache)
+
+
+# Release fields used by check_for_updates (everything else is dropped)
+_RELEASE_FIELDS = ('tag_name', 'zipball_url', 'body', 'html_url')
+_ASSET_FIELDS = ('name', 'browser_download_url', 'digest')
+
+
+def _trim_release(data):
+    """
+    Keep only the release fields the updater reads
+    
+    The full GitHub payload carries author/uploader objects and URLs for
+    every asset; trimming it keeps the cache file small to load.
+    """
+    release = dict((key, data[key]) for key in _RELEASE_FIELDS if key in data)
+    release['assets'] = [
+        dict((key, asset[key]) for key in _ASSET_FIELDS if key in asset)
+        for asset in data.get('assets') or []
+    ]
+    return release
+
+
+def _peek_tag_name(raw):
+    """
+    Find the release tag in raw GitHub JSON bytes without parsing the JSON
     
-    if latest_tuple > current_tuple:
-        return 1
-    elif latest_tuple == current_tuple:
+    Returns:
+        str: tag_name value, or None if not found
+    """
+    import re
+    
+    match = re.search(br'"tag_name"\s*:\s*"([^"\\]+)"', raw)
+    if match is None:
+        return None
+    return match.group(1).decode('utf-8')
+
+
+def _cache_max_age(headers):
+    """Get max-age seconds from a Cache-Control header (0 if missing)"""
+    if headers is None:
         return 0
+    for directive in (headers.get('Cache-Control') or '').split(','):
+        name, _, value = directive.strip().partition('=')
+        if name.lower() == 'max-age':
+            try:
+                return max(int(value), 0)
+            except ValueError:
+                return 0
+    return 0
+
+
+def _fetch_latest_release(use_cache_ttl=True):
+    """
+    Get the latest GitHub release JSON, reusing the local cache where possible
+    
+    Sends If-None-Match with the cached ETag; GitHub answers 304 (empty body,
+    not counted against the rate limit) when the release hasn't changed.
+    Within the response's Cache-Control max-age no request is sent at all.
+    
+    Args:
+        use_cache_ttl: If True, return a cached response younger than
+                       MIN_CHECK_INTERVAL without any network request, and
+                       respect the backoff after server/network errors
+    
+    Returns:
+        dict: Release data
+    
+    Raises:
+        _BackoffActive while rate limited or backing off,
+        HTTPError/URLError on network failure, ValueError on invalid JSON
+    """
+    try:
+        from urllib.error import URLError, HTTPError
+    except ImportError:
+        from urllib2 import URLError, HTTPError
+    
+    cache = _load_release_cache()
+    cached_payload = cache.get('payload')
+    now = time.time()
+    current_version = get_current_version()
+    
+    # A tag-only payload only answers "no update" for the version it was
+    # checked against; after a local version change, fetch the full release
+    if cached_payload and 'assets' not in cached_payload and \
+       cache.get('checked_version') != current_version:
+        cached_payload = None
+    
+    fresh_for = cache.get('max_age', 0)
+    if use_cache_ttl:
+        fresh_for = max(fresh_for, MIN_CHECK_INTERVAL)
+    if cached_payload and now - cache.get('fetched_at', 0) < fresh_for:
+        return cached_payload
+    
+    wait = cache.get('rate_limit_until', 0) - now
+    if use_cache_ttl:
+        wait = max(wait, cache.get('retry_at', 0) - now)
+    if wait > 0:
+        raise _BackoffActive(wait)
+    
+    headers = {}
+    if cached_payload and cache.get('etag'):
+        headers['If-None-Match'] = cache['etag']
+    
+    try:
+        if use_cache_ttl and not _host_reachable(GITHUB_API_URL):
+            # Offline: fail fast (and back off) instead of waiting for timeouts
+            raise URLError('GitHub is unreachable')
+        response = _open_url(GITHUB_API_URL, headers=headers)
+    except HTTPError as e:
+        if e.code == 304 and cached_payload:
+            cache['fetched_at'] = time.time()
+            cache['max_age'] = _cache_max_age(getattr(e, 'headers', None) or getattr(e, 'hdrs', None))
+            for key in ('failures', 'retry_at', 'rate_limit_until'):
+                cache.pop(key, None)
+            _save_release_cache(cache)
+            return cached_payload
+        _record_check_failure(cache, e)
+        raise
+    except URLError as e:
+        _record_check_failure(cache, e)
+        raise
+    
+    try:
+        raw = response.read()
+    finally:
+        _release_response(response)
+    
+    # Common case, no newer release: the tag is all that's needed, so skip
+    # parsing assets and release notes
+    tag_name = _peek_tag_name(raw)
+    if tag_name and compare_versions(current_version, tag_name.lstrip('vV')) != 1:
+        data = {'tag_name': tag_name}
     else:
-        return -1
+        data = _trim_release(json.loads(raw.decode('utf-8')))
+    
+    _save_release_cache({
+        'etag': response.headers.get('ETag'),
+        'payload': data,
+        'checked_version': current_version,
+        'fetched_at': time.time(),
+        'max_age': _cache_max_age(response.headers)
+    })
+    return data
 
 
 def check_for_updates(return_error=False):
@@ -146,22 +710,26 @@ def check_for_updates(return_error=False):
         dict: Update info dict, or None/error dict on failure
     """
     try:
-        # Python 2/3 compatible HTTP request
+        # Python 2/3 compatible HTTP errors
         try:
             # Python 3
-            from urllib.request import urlopen, Request
             from urllib.error import URLError, HTTPError
         except ImportError:
             # Python 2
-            from urllib2 import urlopen, Request, URLError, HTTPError
-        
-        # Set User-Agent (required by GitHub API)
-        request = Request(GITHUB_API_URL)
-        request.add_header('User-Agent', 'YB-Tools-Updater')
+            from urllib2 import URLError, HTTPError
         
-        # Request GitHub API
+        # Request GitHub API (background checks may use the cached response)
         try:
-            response = urlopen(request, timeout=UPDATE_CHECK_TIMEOUT)
+            data = _fetch_latest_release(use_cache_ttl=not return_error)
+        except _BackoffActive as e:
+            if return_error:
+                minutes = int(e.wait // 60) + 1
+                return {'error': 'GitHub API is rate limited. Please try again in {} minute(s).'.format(minutes)}
+            return None
+        except HTTPError as e:
+            if return_error:
+                return {'error': 'GitHub API error ({}): {}. Please try again later.'.format(e.code, e.reason)}
+            return None
         except URLError as e:
             if return_error:
                 error_msg = str(e)
@@ -172,13 +740,6 @@ def check_for_updates(return_error=False):
                 else:
                     return {'error': 'Network error: {}. Please check your network connection.'.format(error_msg)}
             return None
-        except HTTPError as e:
-            if return_error:
-                return {'error': 'GitHub API error ({}): {}. Please try again later.'.format(e.code, e.reason)}
-            return None
-        
-        try:
-            data = json.loads(response.read().decode('utf-8'))
         except ValueError as e:
             if return_error:
                 return {'error': 'Invalid response from GitHub API. Please try again later.'}
@@ -205,10 +766,15 @@ def check_for_updates(return_error=False):
         
         # Find zip download link
         download_url = None
+        sha256 = None
         assets = data.get('assets', [])
         for asset in assets:
             if asset.get('name', '').endswith('.zip'):
                 download_url = asset.get('browser_download_url')
+                # GitHub publishes "sha256:<hex>" digests for uploaded assets
+                digest = asset.get('digest') or ''
+                if digest.startswith('sha256:'):
+                    sha256 = digest[len('sha256:'):].lower()
                 break
         
         # If no zip uploaded, use source zip
@@ -219,6 +785,7 @@ def check_for_updates(return_error=False):
             'has_update': True,
             'latest_version': latest_version,
             'download_url': download_url,
+            'sha256': sha256,
             'release_notes': data.get('body', ''),
             'release_url': data.get('html_url', '')
         }
@@ -230,177 +797,527 @@ def check_for_updates(return_error=False):
         return None
 
 
-def download_update(download_url, target_path, progress_callback=None):
+def _response_status(response):
+    """Get HTTP status code of a urllib or urllib3 response"""
+    return getattr(response, 'status', None) or response.getcode()
+
+
+def _range_total_size(response):
+    """
+    Get total file size from a 206 range response ("Content-Range: bytes 0-M/N")
+    
+    Returns None if the server ignored the range request
+    """
+    if _response_status(response) != 206:
+        return None
+    try:
+        return int(response.headers.get('Content-Range', '').rsplit('/', 1)[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def _download_stream(response, output, progress_callback=None, digest=None):
+    """
+    Download a whole response body to the output file object in a single stream
+    
+    If digest (a hashlib object) is given, it is updated with every chunk
+    as it is written, so no second pass over the file is needed.
+    """
+    total_size = int(response.headers.get('Content-Length', 0))
+    downloaded = 0
+    last_progress = -1
+    
+    while True:
+        chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        output.write(chunk)
+        if digest is not None:
+            digest.update(chunk)
+        downloaded += len(chunk)
+        
+        if progress_callback and total_size > 0:
+            progress = int(downloaded * 100 / total_size)
+            # Only report when the percentage actually changes
+            if progress != last_progress:
+                last_progress = progress
+                progress_callback("downloading", progress)
+
+
+def _download_ranges(url, output, total_size, progress_callback=None):
+    """
+    Download a file with parallel HTTP range requests
+    
+    Each worker writes its own slice of the output file object at its
+    offset, so several connections share the transfer instead of one
+    capped stream. Workers are daemon threads (not a ThreadPoolExecutor,
+    whose threads are joined at interpreter exit), so quitting Nuke never
+    waits for a download.
+    
+    Returns:
+        bool: True if every range was downloaded completely
+    """
+    import threading
+    
+    part_size = -(-total_size // DOWNLOAD_WORKERS)
+    ranges = [(start, min(start + part_size, total_size) - 1)
+              for start in range(0, total_size, part_size)]
+    
+    lock = threading.Lock()
+    state = {'downloaded': 0, 'progress': -1}
+    errors = []
+    
+    def _fetch_range(start, end):
+        try:
+            _read_range(start, end)
+        except Exception as e:
+            errors.append(e)
+    
+    def _read_range(start, end):
+        response = _open_url(url, headers=dict(DOWNLOAD_HEADERS, Range='bytes={}-{}'.format(start, end)),
+                             timeout=DOWNLOAD_READ_TIMEOUT)
+        try:
+            if _response_status(response) != 206:
+                raise IOError("Server ignored range request")
+            
+            position = start
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = response.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise IOError("Incomplete range response")
+                remaining -= len(chunk)
+                
+                with lock:
+                    # Workers share one output object: seek and write together
+                    output.seek(position)
+                    output.write(chunk)
+                    state['downloaded'] += len(chunk)
+                    progress = int(state['downloaded'] * 100 / total_size)
+                    # Only report when the percentage actually changes
+                    changed = progress != state['progress']
+                    state['progress'] = progress
+                position += len(chunk)
+                if progress_callback and changed:
+                    progress_callback("downloading", progress)
+        finally:
+            _release_response(response)
+    
+    workers = []
+    for start, end in ranges:
+        worker = threading.Thread(target=_fetch_range, args=(start, end),
+                                  name='yb-updater-range-{}'.format(start))
+        worker.daemon = True  # Daemon thread, won't block Nuke exit
+        worker.start()
+        workers.append(worker)
+    for worker in workers:
+        worker.join()
+    
+    return not errors
+
+
+def _sha256_of(output):
+    """
+    Get SHA256 hex digest of a file object's whole content
+    
+    Chunks are read into one reused buffer (readinto + memoryview), so no
+    bytes object is allocated per chunk.
+    """
+    import hashlib
+    
+    digest = hashlib.sha256()
+    output.seek(0)
+    
+    view = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+    while True:
+        size = output.readinto(view)
+        if not size:
+            break
+        digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def download_update(download_url, target_path, progress_callback=None, in_memory=False,
+                    expected_sha256=None):
     """
     Download update package
     
+    Uses parallel range requests when the server supports them and the file
+    is large enough, otherwise a single stream.
+    
     Args:
         download_url: URL to download from
         target_path: Local path to save the file
         progress_callback: Optional callback function(status, progress) for progress updates
+        in_memory: If True, keep packages of known size up to
+                   DOWNLOAD_MEMORY_MAX_SIZE in memory instead of writing
+                   them to target_path
+        expected_sha256: Optional SHA256 hex digest the package must match
     
     Returns:
-    True: Download successful
+    BytesIO: Download successful, package kept in memory (in_memory only)
+    True: Download successful, package saved to target_path
     False: Download failed
     """
+    import io
+    import hashlib
+    
+    output = None
+    success = False
     try:
-        try:
-            from urllib.request import urlopen, Request
-        except ImportError:
-            from urllib2 import urlopen, Request
-        
         if progress_callback:
             progress_callback("downloading", 0)
         
-        request = Request(download_url)
-        request.add_header('User-Agent', 'YB-Tools-Updater')
+        # Open-ended range: 206 means ranges are supported, 200 means the
+        # server ignored it. Either way the response carries the whole file,
+        # so small or unsized downloads stream it without a second request
+        response = _open_url(download_url, headers=dict(DOWNLOAD_HEADERS, Range='bytes=0-'),
+                             timeout=DOWNLOAD_READ_TIMEOUT)
+        total_size = _range_total_size(response)
         
-        response = urlopen(request)
-        total_size = int(response.headers.get('Content-Length', 0))
-        downloaded = 0
-        chunk_size = 8192
+        # BytesIO rather than SpooledTemporaryFile: zipfile needs seekable(),
+        # which SpooledTemporaryFile only has from Python 3.11
+        package_size = total_size or int(response.headers.get('Content-Length', 0))
+        if in_memory and 0 < package_size <= DOWNLOAD_MEMORY_MAX_SIZE:
+            output = io.BytesIO()
+        else:
+            output = open(target_path, 'w+b')
         
-        with open(target_path, 'wb') as f:
-            while True:
-                chunk = response.read(chunk_size)
-                if not chunk:
-                    break
-                f.write(chunk)
-                downloaded += len(chunk)
-                
-                if progress_callback and total_size > 0:
-                    progress = int((downloaded / total_size) * 100)
-                    progress_callback("downloading", progress)
+        if total_size is not None and total_size >= DOWNLOAD_PARALLEL_MIN_SIZE:
+            # Range requests go straight to the final (redirected) URL
+            final_url = getattr(response, 'geturl', lambda: None)() or download_url
+            _release_response(response)
+            
+            if _download_ranges(final_url, output, total_size, progress_callback):
+                response = None
+            else:
+                # Discard any partial range data before the full download
+                output.seek(0)
+                output.truncate()
+                response = _open_url(download_url, headers=DOWNLOAD_HEADERS, timeout=DOWNLOAD_READ_TIMEOUT)
+        
+        if response is not None:
+            # Single stream: hash while writing
+            digest = hashlib.sha256() if expected_sha256 else None
+            try:
+                _download_stream(response, output, progress_callback, digest)
+            finally:
+                _release_response(response)
+            actual_sha256 = digest.hexdigest() if digest else None
+        elif expected_sha256:
+            # Ranges arrive out of order, hash the assembled package
+            output.flush()
+            actual_sha256 = _sha256_of(output)
+        
+        if expected_sha256 and actual_sha256 != expected_sha256.lower():
+            _nuke_tprint("[YB Tools] Downloaded update package is corrupt (SHA256 mismatch).")
+            return False
         
         if progress_callback:
             progress_callback("downloading", 100)
         
+        success = True
+        if isinstance(output, io.BytesIO):
+            output.seek(0)
+            return output
         return True
         
     except Exception:
         return False
+    
+    finally:
+        if output is not None and not (success and isinstance(output, io.BytesIO)):
+            output.close()
+            # Never leave a partial or corrupt package behind
+            if not success and not isinstance(output, io.BytesIO):
+                try:
+                    os.remove(target_path)
+                except Exception:
+                    pass
+
+
+# Plugin root search inside update archives
+PLUGIN_ROOT_MAX_DEPTH = 3
+_PLUGIN_ROOT_SKIP_DIRS = frozenset(['.git', '__pycache__', '.DS_Store', 'node_modules'])
 
+# Archive path components never extracted by apply_update. version.json is
+# kept from the installed plugin so user settings (auto_update) survive.
+_EXCLUDE_EXACT = frozenset(['.git', '__pycache__', '.DS_Store', VERSION_CONFIG_FILE])
+# Archive file name endings never extracted (compiled bytecode)
+_EXCLUDE_SUFFIX = ('.pyc', '.pyo')
 
-def find_plugin_root_in_dir(directory):
+
+def find_plugin_root_in_zip(names):
     """
-    Find plugin root directory in extracted directory
+    Find plugin root directory inside a ZIP archive
+    
+    Plugin root directory should contain init.py and menu.py files.
+    GitHub zipballs nest everything under a single "<repo>-<sha>/" folder.
+    
+    Args:
+        names: Member names of the archive (ZipFile.namelist())
     
-    Plugin root directory should contain init.py and menu.py files
+    Returns:
+        str: Member name prefix of the plugin root ('' for archive root,
+             otherwise ending with '/'), or None if not found
     """
-    # Check if current directory is plugin root
-    if os.path.exists(os.path.join(directory, 'init.py')) and \
-       os.path.exists(os.path.join(directory, 'menu.py')):
-        return directory
+    name_set = set(names)
     
-    # Recursively search subdirectories
-    for root, dirs, files in os.walk(directory):
-        if 'init.py' in files and 'menu.py' in files:
-            return root
+    # Shallowest directory containing both init.py and menu.py. Only the
+    # first few levels are considered, and copies inside VCS/cache folders
+    # are ignored.
+    prefixes = []
+    for name in names:
+        if name != 'init.py' and not name.endswith('/init.py'):
+            continue
+        parts = name.split('/')[:-1]
+        if len(parts) >= PLUGIN_ROOT_MAX_DEPTH or _PLUGIN_ROOT_SKIP_DIRS.intersection(parts):
+            continue
+        prefixes.append(name[:-len('init.py')])
+    for prefix in sorted(prefixes, key=len):
+        if prefix + 'menu.py' in name_set:
+            return prefix
     
+    # Otherwise accept archive root, or a single top-level directory
+    # (GitHub zipball format), as long as it contains init.py
+    top_level = set(name.split('/', 1)[0] for name in names)
+    if len(top_level) == 1:
+        nested = top_level.pop() + '/'
+        if nested + 'init.py' in name_set:
+            return nested
+    if 'init.py' in name_set:
+        return ''
     return None
 
 
-def apply_update(zip_path, new_version=None):
+def _remove_path(path):
+    """
+    Delete a file or directory tree, ignoring paths that don't exist
+    
+    Tries rmtree first and only falls back to os.remove when the path isn't
+    a directory, instead of stat-ing the path before deleting it.
+    """
+    import errno
+    import shutil
+    
+    try:
+        shutil.rmtree(path)
+    except OSError as e:
+        # Not a directory (file or symlink): delete it as a file
+        try:
+            os.remove(path)
+        except OSError:
+            if e.errno != errno.ENOENT:
+                raise
+
+
+def _dir_entries(path):
+    """
+    Get the entries of a directory with a single directory read
+    
+    os.scandir reports each entry's type without a stat() per entry.
+    
+    Returns:
+        dict: {name: is_dir}, symlinks count as files
+    """
+    try:
+        scandir = os.scandir
+    except AttributeError:
+        # Python 2: no scandir, stat each entry
+        return dict((name, os.path.isdir(os.path.join(path, name)) and
+                     not os.path.islink(os.path.join(path, name)))
+                    for name in os.listdir(path))
+    return dict((entry.name, entry.is_dir(follow_symlinks=False)) for entry in scandir(path))
+
+
+def _replace_items(source_dir, target_dir):
+    """Move every top-level item of source_dir into target_dir, replacing existing ones"""
+    import shutil
+    
+    existing = _dir_entries(target_dir)
+    for item in os.listdir(source_dir):
+        source_item = os.path.join(source_dir, item)
+        target_item = os.path.join(target_dir, item)
+        try:
+            # Delete old files/directories
+            if existing.get(item):
+                shutil.rmtree(target_item)
+            elif item in existing:
+                os.remove(target_item)
+            shutil.move(source_item, target_item)
+        except Exception:
+            # Continue processing other files
+            pass
+
+
+def _move_missing_items(source_dir, target_dir):
+    """
+    Move top-level items of source_dir that don't exist in target_dir
+    
+    Returns:
+        list: Names of items that could not be moved
+    """
+    # One directory read instead of an exists() check per item
+    existing = set(os.listdir(target_dir))
+    failed = []
+    for item in os.listdir(source_dir):
+        if item in existing:
+            continue
+        try:
+            os.rename(os.path.join(source_dir, item), os.path.join(target_dir, item))
+        except Exception:
+            failed.append(item)
+    return failed
+
+
+def apply_update(zip_path, new_version=None, skip_crc=False):
     """
     Apply update (extract to plugin directory)
     
+    Archive members are streamed into a sibling "<plugin>.new.<pid>" directory,
+    which then replaces the plugin directory by rename. Files the update
+    doesn't ship are carried over from the old directory. When the plugin
+    directory is a symlink or its parent isn't writable, the staged items
+    replace the plugin's top-level items one by one instead.
+    
+    zipfile checks every member's CRC32 while it is read. When the whole
+    package was already checked against the release's SHA256 digest, that
+    per-member CRC is redundant and can be skipped with skip_crc. Without
+    a verified digest, keep the CRC check: it is the only corruption check.
+    
     Args:
-        zip_path: Path to the update ZIP file
+        zip_path: Path to the update ZIP file, or a file-like object
         new_version: New version string to update in version.json (optional)
+        skip_crc: Skip per-member CRC32 checks (only for SHA256-verified packages)
     
     Returns:
         bool: True if update was successful, False otherwise
     """
-    plugin_root = get_plugin_root()
-    temp_dir = None
+    import zipfile
+    import shutil
+    import tempfile
+    
+    # Rename the real directory, never a symlink pointing at it
+    plugin_root = os.path.realpath(get_plugin_root())
+    can_swap = not os.path.islink(get_plugin_root())
+    # Siblings of the plugin directory, so every rename stays on one
+    # filesystem (no EXDEV). The pid keeps two Nuke sessions sharing a
+    # plugin directory from using the same staging/backup folders.
+    staging_dir = '{}.new.{}'.format(plugin_root, os.getpid())
+    backup_dir = '{}.old.{}'.format(plugin_root, os.getpid())
     
     try:
-        # Validate ZIP file
-        if not os.path.exists(zip_path):
+        # Validate ZIP file: only the end-of-central-directory record is read.
+        # No testzip() CRC pass, a corrupt member fails when it's extracted.
+        if not zipfile.is_zipfile(zip_path):
             return False
         
-        # Check if ZIP file is valid
+        # Python 2/3 compatible BadZipFile exception
         try:
-            # Python 2/3 compatible BadZipFile exception
-            try:
-                BadZipFile = zipfile.BadZipFile
-            except AttributeError:
-                # Python 2 uses zipfile.error
-                BadZipFile = zipfile.error
-            
-            with zipfile.ZipFile(zip_path, 'r') as test_zip:
-                test_zip.testzip()
-        except (BadZipFile, zipfile.error):
-            return False
-        except Exception:
-            return False
-        
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp(prefix='yb_tools_update_')
+            BadZipFile = zipfile.BadZipFile
+        except AttributeError:
+            # Python 2 uses zipfile.error
+            BadZipFile = zipfile.error
         
-        # Extract update package
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Extract all files
-                zip_ref.extractall(temp_dir)
-        except Exception:
+            zip_ref = zipfile.ZipFile(zip_path, 'r')
+        except (BadZipFile, zipfile.error):
             return False
         
-        # Find plugin root directory
-        source_dir = find_plugin_root_in_dir(temp_dir)
-        
-        if not source_dir:
-            # If not found, try other methods
-            extracted_items = os.listdir(temp_dir)
+        with zip_ref:
+            names = zip_ref.namelist()
             
-            # If only one directory, might be GitHub zipball format
-            if len(extracted_items) == 1 and os.path.isdir(os.path.join(temp_dir, extracted_items[0])):
-                nested_dir = os.path.join(temp_dir, extracted_items[0])
-                source_dir = find_plugin_root_in_dir(nested_dir)
-                if not source_dir:
-                    source_dir = nested_dir
-            else:
-                source_dir = temp_dir
-        
-        if not source_dir:
-            return False
-        
-        # Verify source directory contains necessary files
-        if not os.path.exists(os.path.join(source_dir, 'init.py')):
-            return False
-        
-        # Copy new files (exclude certain files)
-        exclude_patterns = ['.git', '__pycache__', '.DS_Store']
-        exclude_files = []
-        
-        copied_count = 0
-        for item in os.listdir(source_dir):
-            # Skip excluded files/directories
-            if item in exclude_files:
-                continue
-            if any(pattern in item for pattern in exclude_patterns):
-                continue
+            # Find plugin root directory
+            prefix = find_plugin_root_in_zip(names)
+            if prefix is None:
+                return False
             
-            source_item = os.path.join(source_dir, item)
-            target_item = os.path.join(plugin_root, item)
+            # Collect members to extract (exclude certain files)
+            members = []
+            for info in zip_ref.infolist():
+                name = info.filename
+                if not name.startswith(prefix):
+                    continue
+                rel_path = name[len(prefix):].rstrip('/')
+                if not rel_path:
+                    continue
+                parts = rel_path.split('/')
+                if _EXCLUDE_EXACT.intersection(parts) or parts[-1].endswith(_EXCLUDE_SUFFIX):
+                    continue
+                # Never write outside the plugin directory
+                if '..' in parts or rel_path.startswith('/') or ':' in parts[0]:
+                    continue
+                members.append((info, parts))
             
+            # Stream new files into a staging directory next to the plugin,
+            # so the installed plugin is untouched until everything is ready
+            _remove_path(staging_dir)
             try:
-                # Delete old files/directories
-                if os.path.exists(target_item):
-                    if os.path.isdir(target_item):
-                        shutil.rmtree(target_item)
-                    else:
-                        os.remove(target_item)
-                
-                # Copy new files/directories
-                if os.path.isdir(source_item):
-                    shutil.copytree(source_item, target_item)
+                os.makedirs(staging_dir)
+            except OSError:
+                # Parent directory not writable: stage in the temp directory
+                # and replace items in place (no directory swap possible)
+                staging_dir = tempfile.mkdtemp(prefix='yb_update_')
+                can_swap = False
+            
+            # Directories created so far (the staging directory starts empty,
+            # so no per-member existence check is needed)
+            created_dirs = set([staging_dir])
+            for info, parts in members:
+                target_path = os.path.join(staging_dir, *parts)
+                if info.filename.endswith('/'):
+                    target_dir = target_path
                 else:
-                    shutil.copy2(source_item, target_item)
-                copied_count += 1
-            except Exception:
-                # Continue processing other files
+                    target_dir = os.path.dirname(target_path)
+                if target_dir not in created_dirs:
+                    if not os.path.isdir(target_dir):
+                        os.makedirs(target_dir)
+                    created_dirs.add(target_dir)
+                if info.filename.endswith('/'):
+                    continue
+                
+                # Open by ZipInfo, skipping the name lookup in the archive index
+                with zip_ref.open(info) as src, open(target_path, 'wb') as dst:
+                    if skip_crc:
+                        # ZipExtFile skips the CRC update/check when no CRC is expected
+                        src._expected_crc = None
+                    shutil.copyfileobj(src, dst, 1 << 20)
+        
+        # Verify staged update contains necessary files
+        if not os.path.exists(os.path.join(staging_dir, 'init.py')):
+            return False
+        
+        # Swap directories: two renames instead of deleting and copying
+        # every file, and a crash never leaves a half-updated plugin
+        swapped = False
+        # A backup kept by an earlier update may still hold user files
+        if can_swap and not os.path.lexists(backup_dir):
+            try:
+                os.rename(plugin_root, backup_dir)
+            except OSError:
                 pass
+            else:
+                try:
+                    os.rename(staging_dir, plugin_root)
+                    swapped = True
+                except OSError:
+                    # Put the installed plugin back before falling back
+                    os.rename(backup_dir, plugin_root)
+        
+        if swapped:
+            # Keep files the update doesn't ship (caches, user files).
+            # backup_dir is the real directory renamed above, not a link.
+            if os.path.isdir(backup_dir) and not os.path.islink(backup_dir):
+                if _move_missing_items(backup_dir, plugin_root):
+                    # Never delete files that weren't carried over
+                    _nuke_tprint("[YB Tools] Some files could not be moved into the updated plugin. "
+                                 "The previous version was kept at: {}".format(backup_dir))
+                else:
+                    shutil.rmtree(backup_dir, ignore_errors=True)
+        else:
+            # Plugin directory is a symlink or can't be renamed (open handle
+            # on Windows, mount point, ...): replace its top-level items one by one
+            _replace_items(staging_dir, plugin_root)
         
         # Update successful, update version.json if new version is provided
         if new_version:
@@ -409,19 +1326,16 @@ def apply_update(zip_path, new_version=None):
                 config = load_version_config()
                 config['version'] = new_version
                 # Preserve auto_update setting
-                try:
-                    with open(config_path, 'w', encoding='utf-8') as f:
-                        json.dump(config, f, indent=4, ensure_ascii=False)
-                except (TypeError, UnicodeEncodeError):
-                    # Fallback for Python 2
-                    with open(config_path, 'w') as f:
-                        json.dump(config, f, indent=4)
+                _atomic_write_json(config_path, config, indent=4)
             except Exception:
                 # Continue even if version update fails
                 pass
+            finally:
+                # Force the next load to re-read version.json
+                _invalidate_version_cache()
         
         # Delete ZIP file
-        if os.path.exists(zip_path):
+        if not hasattr(zip_path, 'read') and os.path.exists(zip_path):
             try:
                 os.remove(zip_path)
             except Exception:
@@ -433,12 +1347,9 @@ def apply_update(zip_path, new_version=None):
         return False
         
     finally:
-        # Clean up temporary directory
-        if temp_dir and os.path.exists(temp_dir):
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception:
-                pass
+        # Clean up staging directory (left over if the update failed)
+        if os.path.isdir(staging_dir):
+            shutil.rmtree(staging_dir, ignore_errors=True)
 
 
 def download_and_apply_update_async(update_info, is_auto_update=False, status_callback=None):
@@ -454,13 +1365,13 @@ def download_and_apply_update_async(update_info, is_auto_update=False, status_ca
                          message: Status message string
                          progress: Progress percentage (0-100) or None
     """
+    import tempfile
+    
     def _download_and_apply_thread():
-        # Note: os, sys, importlib are already imported at module level
         plugin_root = get_plugin_root()
         zip_path = os.path.join(tempfile.gettempdir(), 'yb_tools_update.zip')
         
         version = update_info.get('latest_version', '')
-        release_notes = update_info.get('release_notes', '')
         
         def progress_callback(status, progress):
             """Internal progress callback that forwards to status_callback"""
@@ -476,7 +1387,11 @@ def download_and_apply_update_async(update_info, is_auto_update=False, status_ca
             status_callback("downloading", "Downloading update package...", 0)
         
         # Download update with progress
-        if not download_update(update_info['download_url'], zip_path, progress_callback=progress_callback):
+        # Small packages stay in memory, skipping a write and re-read of the ZIP
+        package = download_update(update_info['download_url'], zip_path,
+                                  progress_callback=progress_callback, in_memory=True,
+                                  expected_sha256=update_info.get('sha256'))
+        if not package:
             error_msg = "Failed to download update package. Please check your network connection."
             _nuke_tprint("[YB Tools] " + error_msg)
             if status_callback:
@@ -489,12 +1404,22 @@ def download_and_apply_update_async(update_info, is_auto_update=False, status_ca
             status_callback("applying", "Applying update...", None)
         
         # Apply update immediately
-        if apply_update(zip_path, new_version=version):
+        # A package that matched the release's SHA256 needs no per-member CRC check
+        try:
+            applied = apply_update(zip_path if package is True else package, new_version=version,
+                                   skip_crc=bool(update_info.get('sha256')))
+        finally:
+            if package is not True:
+                package.close()
+        
+        if applied:
             # Update successful - show notification
-            _nuke_tprint("="*70)
-            _nuke_tprint("[YB Tools] YB Tools has been updated to version {}.".format(version))
-            _nuke_tprint("="*70)
-            _nuke_tprint("[YB Tools] IMPORTANT: Please restart Nuke to use the new version.")
+            _nuke_tprint_multi([
+                "="*70,
+                "[YB Tools] YB Tools has been updated to version {}.".format(version),
+                "="*70,
+                "[YB Tools] IMPORTANT: Please restart Nuke to use the new version."
+            ])
             
             restart_message = (
                 "Update completed successfully!\n\n"
@@ -512,35 +1437,35 @@ def download_and_apply_update_async(update_info, is_auto_update=False, status_ca
             if status_callback:
                 status_callback("error", error_msg, None)
     
-    # Start background thread
-    thread = threading.Thread(target=_download_and_apply_thread)
-    thread.daemon = True  # Daemon thread, won't block Nuke exit
-    thread.start()
+    # Run on a background worker
+    if not _submit_task('download', _download_and_apply_thread):
+        if status_callback:
+            status_callback("error", "An update is already being downloaded.", None)
 
 
 def start_update_check():
     """
     Start update check (called after Nuke UI is loaded)
     
-    Entire process doesn't block Nuke startup.
+    Entire process doesn't block Nuke startup, version.json is read on the
+    background worker too. GitHub is contacted at most once per
+    MIN_CHECK_INTERVAL; warm starts reuse the cached response.
     If update is found, it will be downloaded and applied immediately.
     """
-    # Check if auto-update is enabled
-    if not is_auto_update_enabled():
-        return
-    
     # Check for new version in background
     def _check_thread():
+        # Check if auto-update is enabled
+        if not is_auto_update_enabled():
+            return
+        
         update_info = check_for_updates()
         
         if update_info and update_info['has_update']:
             # Download and apply update immediately (silent download, show notification after)
             download_and_apply_update_async(update_info, is_auto_update=True)
     
-    # Start check thread
-    thread = threading.Thread(target=_check_thread)
-    thread.daemon = True
-    thread.start()
+    # Run on a background worker (skipped if a check is already running)
+    _submit_task('check', _check_thread)
 
 
 